@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru /api/analytics: GROUP BY în SQL vs. snapshot-ul columnar NumPy
+
+Usage:
+    python benchmarks/analytics_benchmark.py
+    python benchmarks/analytics_benchmark.py --patients 100000 --analyses 2000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'analytics_benchmark.db')
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{DB_PATH}')
+
+from sqlalchemy import case, func, select
+
+from app import Analysis, Patient, analytics_query, app, db
+from synthetic_data import populate
+
+AGE_GROUP = case((Analysis.varsta_recoltare < 18, 'Copil'), (Analysis.varsta_recoltare < 65, 'Adult'),
+                 (Analysis.varsta_recoltare.is_not(None), 'Senior'))
+
+# (descriere, dimensiuni, filtre, coloane SQL echivalente, condiții SQL echivalente)
+QUERIES = [
+    ('laborator', ['laborator'], {}, [Analysis.laborator], []),
+    ('luna x tip', ['luna', 'tip_analiza'], {},
+     [func.strftime('%Y-%m', Analysis.data_rezultat), Analysis.tip_analiza], []),
+    ('sex x varsta | Glicemia', ['sex', 'grupa_varsta'], {'tip_analiza': ['Glicemia']},
+     [Patient.sex, AGE_GROUP], [Analysis.tip_analiza == 'Glicemia']),
+    ('medic x laborator', ['medic', 'laborator'], {}, [Analysis.medic, Analysis.laborator], []),
+]
+
+
+def sql_group_by(columns, conditions) -> int:
+    """Aceeași agregare executată în SQL"""
+    statement = (select(*columns, func.count(Analysis.id))
+                 .join(Patient, Patient.id == Analysis.patient_id)
+                 .where(*conditions).group_by(*columns))
+    return len(db.session.execute(statement).all())
+
+
+def measure(func, repeat: int) -> float:
+    """Mediana duratei (ms)"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark /api/analytics: SQL vs. snapshot NumPy')
+    parser.add_argument('--patients', type=int, default=50000)
+    parser.add_argument('--analyses', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    app.config['ANALYTICS_REFRESH_INTERVAL'] = 3600
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            populate(db.engine, args.patients, args.analyses)
+
+        start = time.perf_counter()
+        analytics_query(['sex'], {})
+        print(f"🧊 Snapshot încărcat în {time.perf_counter() - start:.2f}s")
+
+        print(f"{'interogare':<26}{'sql (ms)':>12}{'numpy (ms)':>12}{'speedup':>10}")
+        for name, dimensions, filters, columns, conditions in QUERIES:
+            sql = measure(lambda: sql_group_by(columns, conditions), args.repeat)
+            cube = measure(lambda: analytics_query(dimensions, filters), args.repeat)
+            print(f"{name:<26}{sql:>12.1f}{cube:>12.1f}{sql / cube:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
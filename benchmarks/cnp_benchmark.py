@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru validarea CNP: funcțiile scalare vs. validate_cnp_array (NumPy)
+
+Usage:
+    python benchmarks/cnp_benchmark.py
+    python benchmarks/cnp_benchmark.py --count 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import extract_info_from_cnp, validate_cnp_array, validate_cnp_detailed
+
+
+def make_cnps(count: int, valid_ratio: float = 0.8) -> list:
+    """Generează CNP-uri: o parte cu cifră de control corectă, restul aleatorii"""
+    coeficienti = [2, 7, 9, 1, 4, 6, 3, 5, 8, 2, 7, 9]
+    cnps = []
+    for _ in range(count):
+        if random.random() < valid_ratio:
+            body = (f"{random.choice('1256')}{random.randint(0, 20):02d}{random.randint(1, 12):02d}"
+                    f"{random.randint(1, 28):02d}{random.randint(0, 99999):05d}")
+            rest = sum(int(body[i]) * coeficienti[i] for i in range(12)) % 11
+            cnps.append(body + str(1 if rest == 10 else rest))
+        else:
+            cnps.append(''.join(random.choice('0123456789') for _ in range(13)))
+    return cnps
+
+
+def scalar(cnps: list) -> int:
+    """Calea existentă: validate_cnp_detailed + extract_info_from_cnp per CNP"""
+    valid = 0
+    for cnp in cnps:
+        is_valid, _ = validate_cnp_detailed(cnp)
+        if is_valid:
+            extract_info_from_cnp(cnp, validated=True)
+            valid += 1
+    return valid
+
+
+def vectorized(cnps: list) -> int:
+    """Calea vectorizată"""
+    return int(validate_cnp_array(cnps)['valid'].sum())
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark validare CNP scalar vs. vectorizat')
+    parser.add_argument('--count', type=int, default=1000000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    print(f"🔢 Generare {args.count} CNP-uri...")
+    cnps = make_cnps(args.count)
+
+    results = {}
+    for name, func in (('scalar', scalar), ('numpy', vectorized)):
+        start = time.perf_counter()
+        valid = func(cnps)
+        elapsed = time.perf_counter() - start
+        results[name] = elapsed
+        print(f"{name:<8} {elapsed:8.3f}s  {args.count / elapsed:>12,.0f} CNP/s  ({valid} valide)")
+
+    print(f"⚡ Accelerare: {results['scalar'] / results['numpy']:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
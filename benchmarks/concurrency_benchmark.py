@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru accesul concurent la SQLite: configurația implicită vs. pragma-urile din app
+
+Mai multe procese (ca workerii gunicorn) citesc și scriu simultan în aceeași bază de
+date; se măsoară throughput-ul, latența p95 și erorile "database is locked".
+
+Usage:
+    python benchmarks/concurrency_benchmark.py
+    python benchmarks/concurrency_benchmark.py --workers 8 --duration 20 --write-ratio 0.2
+"""
+
+import argparse
+import multiprocessing
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.exc import OperationalError
+
+from app import DEFAULT_SQLITE_PRAGMAS, apply_sqlite_pragmas, db
+from synthetic_data import populate
+
+# Configurația anterioară: jurnal rollback, fsync la fiecare commit
+SCENARIOS = {
+    'implicit': {'journal_mode': 'DELETE', 'synchronous': 'FULL'},
+    'tunat': DEFAULT_SQLITE_PRAGMAS
+}
+
+READ_SQL = text(
+    "SELECT a.id, a.tip_analiza, a.rezultat, a.data_rezultat, p.nume, p.prenume "
+    "FROM analyses a JOIN patients p ON p.id = a.patient_id "
+    "WHERE a.patient_id = :patient_id ORDER BY a.data_rezultat DESC, a.id DESC LIMIT 15"
+)
+WRITE_SQL = text(
+    "INSERT INTO analyses (patient_id, tip_analiza, rezultat, valori_normale, data_recoltare, "
+    "data_rezultat, medic, laborator) VALUES (:patient_id, 'Glicemie', :rezultat, '70-100 mg/dl', "
+    ":data, :data, 'Dr. Benchmark', 'Laborator Benchmark')"
+)
+
+
+def worker(db_path: str, pragmas: dict, total_patients: int, duration: float, write_ratio: float,
+           seed: int, results) -> None:
+    """Execută operații amestecate până la expirarea duratei și raportează statisticile"""
+    random.seed(seed)
+    engine = create_engine(f'sqlite:///{db_path}')
+    event.listen(engine, 'connect', lambda dbapi_connection, record: apply_sqlite_pragmas(dbapi_connection, pragmas))
+
+    stats = {'reads': 0, 'writes': 0, 'locked': 0, 'read_ms': [], 'write_ms': []}
+    deadline = time.perf_counter() + duration
+    with engine.connect() as connection:
+        while time.perf_counter() < deadline:
+            is_write = random.random() < write_ratio
+            params = {'patient_id': random.randint(1, total_patients)}
+            start = time.perf_counter()
+            try:
+                if is_write:
+                    params.update(rezultat=f"{random.uniform(60, 140):.1f} mg/dl", data=date.today().isoformat())
+                    connection.execute(WRITE_SQL, params)
+                    connection.commit()
+                else:
+                    connection.execute(READ_SQL, params).all()
+                    connection.rollback()
+            except OperationalError:
+                connection.rollback()
+                stats['locked'] += 1
+                continue
+            elapsed = (time.perf_counter() - start) * 1000
+            key = 'write' if is_write else 'read'
+            stats[f'{key}s'] += 1
+            stats[f'{key}_ms'].append(elapsed)
+    engine.dispose()
+    results.put(stats)
+
+
+def p95(values: list) -> float:
+    """Percentila 95 (0 dacă nu există valori)"""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=20)[-1]
+
+
+def run_scenario(db_path: str, pragmas: dict, args) -> dict:
+    """Pornește workerii pentru un scenariu și agregă rezultatele"""
+    # journal_mode este persistent în fișier; îl setăm înainte de pornirea workerilor
+    engine = create_engine(f'sqlite:///{db_path}')
+    with engine.connect() as connection:
+        connection.exec_driver_sql(f"PRAGMA journal_mode = {pragmas['journal_mode']}")
+    engine.dispose()
+
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker, args=(db_path, pragmas, args.patients, args.duration,
+                                                     args.write_ratio, args.seed + i, results))
+        for i in range(args.workers)
+    ]
+    for process in processes:
+        process.start()
+    collected = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    return {
+        'reads': sum(s['reads'] for s in collected),
+        'writes': sum(s['writes'] for s in collected),
+        'locked': sum(s['locked'] for s in collected),
+        'read_p95': p95([v for s in collected for v in s['read_ms']]),
+        'write_p95': p95([v for s in collected for v in s['write_ms']])
+    }
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark acces concurent SQLite')
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--analyses', type=int, default=200000)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--duration', type=float, default=10.0, help='Secunde per scenariu')
+    parser.add_argument('--write-ratio', type=float, default=0.1)
+    parser.add_argument('--db', help='Fișier SQLite (implicit: fișier temporar)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'concurrency_benchmark.db')
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        engine = create_engine(f'sqlite:///{db_path}')
+        db.metadata.create_all(engine)
+        print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize în {db_path}...")
+        populate(engine, args.patients, args.analyses)
+        engine.dispose()
+
+    print(f"👷 {args.workers} workeri, {args.duration:.0f}s per scenariu, {args.write_ratio:.0%} scrieri")
+    print(f"{'scenariu':<10}{'citiri/s':>12}{'scrieri/s':>12}{'p95 citire':>14}{'p95 scriere':>14}{'locked':>8}")
+    for name, pragmas in SCENARIOS.items():
+        r = run_scenario(db_path, pragmas, args)
+        print(f"{name:<10}{r['reads'] / args.duration:>12,.0f}{r['writes'] / args.duration:>12,.0f}"
+              f"{r['read_p95']:>12.2f}ms{r['write_p95']:>12.2f}ms{r['locked']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru cache-ul HTTP condiționat: încărcări repetate cu și fără If-None-Match
+
+Pentru dashboard, pagina pacientului, raportul HTML și PDF-ul complet se măsoară
+timpul CPU al procesului per cerere la randarea completă (200) și la revalidare (304).
+
+Usage:
+    python benchmarks/http_cache_benchmark.py
+    python benchmarks/http_cache_benchmark.py --patients 20000 --analyses 400000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'http_cache_benchmark.db')
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{DB_PATH}')
+
+from sqlalchemy import func, select
+
+from app import Analysis, app, db, upgrade_db
+from synthetic_data import populate
+
+
+def measure(client, url: str, headers: dict, repeat: int) -> float:
+    """Mediana timpului CPU (ms) per cerere"""
+    durations = []
+    for _ in range(repeat):
+        start = time.process_time()
+        client.get(url, headers=headers)
+        durations.append((time.process_time() - start) * 1000)
+    return statistics.median(durations)
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark ETag / 304 pentru încărcări repetate')
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--analyses', type=int, default=200000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            populate(db.engine, args.patients, args.analyses)
+    upgrade_db()
+
+    with app.app_context():
+        # Pacientul cu cele mai multe analize (cel mai scump raport)
+        patient_id = db.session.execute(
+            select(Analysis.patient_id).group_by(Analysis.patient_id)
+            .order_by(func.count(Analysis.id).desc()).limit(1)
+        ).scalar()
+
+    urls = ['/', f'/patients/view/{patient_id}', f'/reports/patient/{patient_id}',
+            f'/reports/patient/{patient_id}/pdf']
+    client = app.test_client()
+    print(f"{'url':<32}{'200 (ms CPU)':>14}{'304 (ms CPU)':>14}{'reducere':>10}")
+    for url in urls:
+        etag = client.get(url).headers['ETag']
+        full = measure(client, url, {}, args.repeat)
+        cached = measure(client, url, {'If-None-Match': etag}, args.repeat)
+        print(f"{url:<32}{full:>14.2f}{cached:>14.2f}{full / cached:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru logging: FileHandler sincron vs. coada QueueHandler/QueueListener din app
+
+Se măsoară timpul petrecut pe firul apelant (cel care, în aplicație, servește cererea)
+pentru fiecare apel logger.info; scrierea efectivă pe disc din scenariul cu coadă
+este făcută de firul listener-ului.
+
+Usage:
+    python benchmarks/logging_benchmark.py
+    python benchmarks/logging_benchmark.py --count 200000
+"""
+
+import argparse
+import logging
+import os
+import queue
+import statistics
+import sys
+import tempfile
+import time
+from logging.handlers import QueueListener, RotatingFileHandler
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from app import LOG_FORMAT, JsonFormatter, LazyQueueHandler
+
+
+def measure(log, count: int) -> list:
+    """Durata (µs) a fiecărui apel de logging pe firul curent"""
+    durations = []
+    for i in range(count):
+        start = time.perf_counter()
+        log.info("Pacient editat: %s %s (ID: %s)", 'Popescu', 'Ion', i)
+        durations.append((time.perf_counter() - start) * 1e6)
+    return durations
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    """Logger izolat (fără propagare către root) cu un singur handler"""
+    log = logging.getLogger(name)
+    log.handlers = [handler]
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    return log
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark logging sincron vs. coadă')
+    parser.add_argument('--count', type=int, default=100000)
+    args = parser.parse_args()
+
+    folder = tempfile.mkdtemp()
+
+    file_handler = logging.FileHandler(os.path.join(folder, 'sincron.log'))
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    sync = measure(make_logger('benchmark.sincron', file_handler), args.count)
+    file_handler.close()
+
+    rotating = RotatingFileHandler(os.path.join(folder, 'coada.log'), maxBytes=50 * 1024 * 1024, backupCount=1)
+    rotating.setFormatter(JsonFormatter())
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, rotating)
+    listener.start()
+    queued = measure(make_logger('benchmark.coada', LazyQueueHandler(log_queue)), args.count)
+    start = time.perf_counter()
+    listener.stop()
+    drain = time.perf_counter() - start
+    rotating.close()
+
+    print(f"{'scenariu':<12}{'p50 (µs)':>10}{'p99 (µs)':>10}{'max (µs)':>10}")
+    for name, durations in (('sincron', sync), ('coadă', queued)):
+        p99 = statistics.quantiles(durations, n=100)[-1]
+        print(f"{name:<12}{statistics.median(durations):>10.1f}{p99:>10.1f}{max(durations):>10.1f}")
+    print(f"⏳ Golirea cozii la oprire: {drain:.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Verificarea numărului de interogări SQL: listele nu execută interogări per rând (N+1)
+
+Pentru listele de pacienți și analize (HTML și API) numără instrucțiunile SQL
+executate (evenimentul before_cursor_execute) la două dimensiuni de pagină. Scriptul
+se termină cu cod 1 dacă numărul diferă între cele două dimensiuni sau dacă pagina
+mare nu a fost umplută (datele de test sunt prea puține pentru verificare).
+
+Cache-urile care ar putea ascunde interogări per rând (fragmentele Jinja,
+numărătorile listelor) sunt dezactivate sau golite înaintea fiecărei cereri.
+
+Usage:
+    python benchmarks/query_count_check.py
+    python benchmarks/query_count_check.py --small 5 --large 200 --verbose
+"""
+
+import argparse
+import logging
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+DB_PATH = os.path.join(tempfile.mkdtemp(), 'query_count_check.db')
+os.environ.setdefault('DATABASE_URL', f'sqlite:///{DB_PATH}')
+
+from sqlalchemy import event
+
+from app import Analysis, app, db, invalidate_statistics_cache, run_pending_backfills, upgrade_db
+from synthetic_data import populate
+
+# (endpoint, URL, cheia de configurare a dimensiunii paginii sau None dacă URL-ul are {size})
+CASES = [
+    ('patients_list', '/patients', 'PATIENTS_PAGE_SIZE'),
+    ('patients_list', '/patients?sort=varsta&order=desc', 'PATIENTS_PAGE_SIZE'),
+    ('analyses_list', '/analyses', 'ANALYSES_PAGE_SIZE'),
+    ('analyses_list', '/analyses?sort=medic&order=asc', 'ANALYSES_PAGE_SIZE'),
+    ('api_patients', '/api/patients?limit={size}', None),
+    ('api_analyses', '/api/analyses?limit={size}', None)
+]
+
+
+def count_statements(run) -> int:
+    """Execută run() și returnează numărul de instrucțiuni SQL, pe toate engine-urile"""
+    count = 0
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        nonlocal count
+        count += 1
+
+    with app.app_context():
+        engines = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, 'before_cursor_execute', on_execute)
+    try:
+        run()
+    finally:
+        for engine in engines:
+            event.remove(engine, 'before_cursor_execute', on_execute)
+    return count
+
+
+def page_rows(response, endpoint: str) -> int:
+    """Numărul de rânduri din pagină (API) sau None pentru paginile HTML"""
+    if endpoint.startswith('api_'):
+        return len(response.get_json()['items'])
+    return None
+
+
+def measure(client, endpoint: str, url: str, config_key, size: int) -> tuple:
+    """(interogări SQL, status, rânduri) pentru o cerere cu dimensiunea de pagină dată"""
+    if config_key:
+        app.config[config_key] = size
+    path = url.format(size=size)
+    invalidate_statistics_cache()
+    client.get(path)  # interogările executate o singură dată per proces nu sunt numărate
+    invalidate_statistics_cache()
+    responses = []
+    count = count_statements(lambda: responses.append(client.get(path)))
+    return count, responses[0].status_code, page_rows(responses[0], endpoint)
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Număr constant de interogări SQL indiferent de dimensiunea paginii')
+    parser.add_argument('--patients', type=int, default=2000)
+    parser.add_argument('--analyses', type=int, default=20000)
+    parser.add_argument('--small', type=int, default=5, help='Dimensiunea paginii mici')
+    parser.add_argument('--large', type=int, default=100, help='Dimensiunea paginii mari')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--verbose', action='store_true', help='Afișează numărul de interogări pentru fiecare caz')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    logging.disable(logging.CRITICAL)
+    app.config['FRAGMENT_CACHE_BACKEND'] = None
+    app.config['BACKFILL_IN_BACKGROUND'] = False
+
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            populate(db.engine, args.patients, args.analyses)
+    upgrade_db()
+    # Backfill-urile rămase rulează acum, nu în fundal în timpul măsurătorilor
+    with app.app_context():
+        run_pending_backfills(pause=0)
+
+    client = app.test_client()
+    defaults = {key: app.config[key] for _, _, key in CASES if key}
+    failures = []
+    try:
+        for endpoint, url, config_key in CASES:
+            small = measure(client, endpoint, url, config_key, args.small)
+            large = measure(client, endpoint, url, config_key, args.large)
+            name = f"{endpoint} {url.format(size='N')}"
+            if args.verbose:
+                print(f"{name}: {small[0]} interogări (pagină {args.small}), {large[0]} (pagină {args.large})")
+            if small[1] != 200 or large[1] != 200:
+                failures.append(f"{name}: status {small[1]} / {large[1]}")
+            elif large[2] is not None and large[2] < args.large:
+                failures.append(f"{name}: pagina mare are doar {large[2]} rânduri")
+            elif small[0] != large[0]:
+                failures.append(f"{name}: {small[0]} interogări la {args.small} rânduri, "
+                                f"{large[0]} la {args.large} rânduri")
+    finally:
+        app.config.update(defaults)
+
+    if failures:
+        print(f"❌ {len(failures)} cazuri cu număr variabil de interogări:")
+        for failure in failures:
+            print(f"   {failure}")
+        return 1
+    print(f"✅ {len(CASES)} cazuri, același număr de interogări SQL la pagini de {args.small} și {args.large} rânduri")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
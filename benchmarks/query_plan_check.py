@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Verificarea planurilor de execuție: nicio rută nu parcurge integral tabelele mari
+
+Rulează toate cazurile din suita de benchmark-uri (suite.route_cases) plus filtrele
+care depind de un pacient, capturează fiecare SELECT executat pe baza principală și
+îl trece prin EXPLAIN QUERY PLAN. Scriptul se termină cu cod 1 dacă o interogare:
+
+1. parcurge integral tabelul patients sau analyses (SCAN fără index), sau
+2. parcurge un index întreg și apoi sortează rezultatul (SCAN ... USING INDEX +
+   USE TEMP B-TREE), adică nu există un index potrivit pentru ORDER BY.
+
+Parcurgerile prin indexuri acoperitoare (numărători, MAX) și parcurgerile în ordinea
+indexului oprite de LIMIT sunt acceptate.
+
+Usage:
+    python benchmarks/query_plan_check.py
+    python benchmarks/query_plan_check.py --patients 50000 --analyses 500000 --verbose
+"""
+
+import argparse
+import logging
+import random
+import re
+import sys
+
+from suite import load_samples, route_cases
+
+from sqlalchemy import event
+
+from app import Analysis, app, db, upgrade_db
+from synthetic_data import populate
+
+LARGE_TABLES = ('patients', 'analyses')
+FULL_SCAN = re.compile(rf"^SCAN ({'|'.join(LARGE_TABLES)})$")
+INDEX_SCAN = re.compile(rf"^SCAN ({'|'.join(LARGE_TABLES)}) USING ")
+
+# Parcurgeri integrale intenționate: (prefixul cazului, tabel) -> motiv
+ALLOWED_FULL_SCANS = {
+    ('GET /api/analytics', 'analyses'): 'snapshot-ul columnar este încărcat integral o dată, apoi actualizat incremental'
+}
+
+# Cazuri suplimentare, cu filtre pe pacientul din eșantion
+EXTRA_QUERIES = [
+    '/analyses?patient_id={patient_id}',
+    '/analyses?patient_id={patient_id}&sort=tip_analiza&order=asc',
+    '/analyses?sort=created_at&order=desc',
+    '/analyses?sort=tip_analiza&order=asc',
+    '/analyses?data_start=2020-01-01&data_end=2020-03-31',
+    '/patients?sort=created_at&order=desc',
+    '/patients?sex=M&sort=varsta&order=asc',
+    '/patients?age_min=30&age_max=40'
+]
+
+
+def capture_selects(engine, run) -> list:
+    """Execută run() și returnează (statement, parametri) pentru fiecare SELECT"""
+    captured = []
+
+    def on_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and statement.lstrip().upper().startswith(('SELECT', 'WITH')):
+            captured.append((statement, parameters))
+
+    event.listen(engine, 'before_cursor_execute', on_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, 'before_cursor_execute', on_execute)
+    return captured
+
+
+def explain(engine, statement: str, parameters) -> list:
+    """Liniile (detail) din EXPLAIN QUERY PLAN"""
+    raw = engine.raw_connection()
+    try:
+        return [row[3] for row in raw.cursor().execute(f'EXPLAIN QUERY PLAN {statement}', parameters or ())]
+    finally:
+        raw.close()
+
+
+def plan_problems(case: str, plan: list) -> list:
+    """Problemele unui plan, conform regulilor din docstring-ul modulului"""
+    problems = []
+    for detail in plan:
+        match = FULL_SCAN.match(detail)
+        if match and not any(case.startswith(prefix) and match.group(1) == table
+                             for prefix, table in ALLOWED_FULL_SCANS):
+            problems.append(f'parcurgere integrală: {detail}')
+    if any(INDEX_SCAN.match(detail) for detail in plan) and any('TEMP B-TREE' in detail for detail in plan):
+        problems.append('index parcurs integral și sortat în memorie')
+    return problems
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Verificare EXPLAIN QUERY PLAN pentru toate rutele')
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--analyses', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--verbose', action='store_true', help='Afișează planul fiecărei interogări')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    logging.disable(logging.CRITICAL)
+
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            populate(db.engine, args.patients, args.analyses)
+        engine = db.engine
+    upgrade_db()
+
+    samples = load_samples()
+    client = app.test_client()
+    cases = route_cases(samples)
+    cases += [(f'GET {query}', 'GET', query.format(**samples), None) for query in EXTRA_QUERIES]
+
+    checked = 0
+    failures = []
+    seen = set()
+    for name, method, path, payload in cases:
+        if method == 'GET':
+            run = lambda: client.get(path)
+        else:
+            run = lambda: client.post(path, json=payload)
+        for statement, parameters in capture_selects(engine, run):
+            key = (name, statement)
+            if key in seen:
+                continue
+            seen.add(key)
+            checked += 1
+            plan = explain(engine, statement, parameters)
+            if args.verbose:
+                print(f"{name}\n   {' | '.join(plan)}")
+            for problem in plan_problems(name, plan):
+                failures.append((name, problem, ' '.join(statement.split())[:300]))
+
+    if failures:
+        print(f"❌ {len(failures)} probleme în {checked} interogări:")
+        for name, problem, statement in failures:
+            print(f"   {name}: {problem}\n      {statement}")
+        return 1
+    print(f"✅ {checked} interogări verificate, fără parcurgeri integrale ale tabelelor {', '.join(LARGE_TABLES)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru căutare: ILIKE '%q%' vs. index FTS5
+
+Generează o bază de date SQLite temporară cu pacienți și analize sintetice,
+apoi măsoară latența interogărilor folosite de /api/search pe ambele căi.
+
+Usage:
+    python benchmarks/search_benchmark.py
+    python benchmarks/search_benchmark.py --patients 100000 --analyses 2000000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, or_, select
+
+from app import Analysis, Patient, build_fts_query, db, fts_rowids
+from synthetic_data import populate
+
+QUERIES = ['pop', 'stefan', 'ionescu maria', '1900', 'glicemia', 'synevo']
+
+
+def ilike_statements(q: str):
+    """Interogările de pe calea veche (ILIKE '%q%')"""
+    return [
+        select(Patient.id).where(or_(Patient.nume.ilike(f'%{q}%'),
+                                     Patient.prenume.ilike(f'%{q}%'),
+                                     Patient.cnp.ilike(f'%{q}%'))).limit(10),
+        select(Analysis.id).where(or_(Analysis.tip_analiza.ilike(f'%{q}%'),
+                                      Analysis.rezultat.ilike(f'%{q}%'),
+                                      Analysis.medic.ilike(f'%{q}%'))).limit(10)
+    ]
+
+
+def fts_statements(q: str):
+    """Interogările pe indexul FTS5 (ordonate după relevanță)"""
+    return [
+        fts_rowids('patients_fts', build_fts_query(q), ranked=True).limit(10),
+        fts_rowids('analyses_fts', build_fts_query(q, ['tip_analiza', 'rezultat', 'medic']),
+                   ranked=True).limit(10)
+    ]
+
+
+def measure(connection, statements, repeat: int) -> list:
+    """Returnează duratele (ms) pentru execuția completă a instrucțiunilor"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for statement in statements:
+            connection.execute(statement).all()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark căutare ILIKE vs. FTS5')
+    parser.add_argument('--patients', type=int, default=100000)
+    parser.add_argument('--analyses', type=int, default=2000000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--db', help='Fișier SQLite (implicit: fișier temporar)')
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    db_path = args.db or os.path.join(tempfile.mkdtemp(), 'search_benchmark.db')
+    engine = create_engine(f'sqlite:///{db_path}')
+
+    if not os.path.exists(db_path) or os.path.getsize(db_path) == 0:
+        db.metadata.create_all(engine)
+        print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize în {db_path}...")
+        start = time.perf_counter()
+        populate(engine, args.patients, args.analyses)
+        print(f"   gata în {time.perf_counter() - start:.1f}s")
+
+    print(f"{'query':<16}{'ilike p50 (ms)':>16}{'fts p50 (ms)':>16}{'speedup':>10}")
+    with engine.connect() as connection:
+        for q in QUERIES:
+            ilike = statistics.median(measure(connection, ilike_statements(q), args.repeat))
+            fts = statistics.median(measure(connection, fts_statements(q), args.repeat))
+            print(f"{q:<16}{ilike:>16.2f}{fts:>16.2f}{ilike / fts if fts else float('inf'):>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
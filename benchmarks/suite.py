@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Suita de benchmark-uri: micro-benchmark-uri și toate rutele GET prin clientul de test Flask
+
+Generează o bază SQLite temporară cu date sintetice (synthetic_data.populate), apoi
+măsoară fiecare caz de --repeat ori și raportează p50/p95/p99 și numărul de
+interogări SQL per execuție. Rezultatele sunt comparate cu baseline-ul salvat
+(benchmarks/baseline.json); scriptul se termină cu cod 1 dacă un caz a devenit
+mai lent decât toleranța, execută mai multe interogări SQL sau își schimbă statusul.
+Un răspuns 5xx este întotdeauna o regresie și nu este salvat niciodată în baseline.
+
+Usage:
+    python benchmarks/suite.py
+    python benchmarks/suite.py --patients 100000 --analyses 1000000 --no-compare
+    python benchmarks/suite.py --save-baseline
+    python benchmarks/suite.py --only api_ --repeat 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+WORK_DIR = tempfile.mkdtemp()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(WORK_DIR, 'suite.db')}")
+
+from sqlalchemy import event, func, select
+
+from app import (Analysis, Patient, analytics_query, app, compute_statistics, db, get_rollup, load_pdf_source,
+                 lookup_patients, render_patient_pdf, upgrade_db, validate_cnp_array)
+from synthetic_data import populate
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+
+# Rute excluse: modifică date prin GET, au nevoie de un job existent sau exportă toată baza
+SKIPPED_ENDPOINTS = {'static', 'delete_patient', 'delete_analysis', 'pdf_job_status', 'pdf_job_download',
+                     'export_patient_pdfs'}
+
+# Variante suplimentare (query string) pentru rutele cu filtre
+QUERY_VARIANTS = {
+    'patients_list': ['', '?search=pop', '?sort=varsta&order=desc', '?sex=F&age_min=30&age_max=50'],
+    'analyses_list': ['', '?tip_analiza=Glicemia', '?anormal=1', '?sort=medic&order=asc'],
+    'api_search': ['?q=pop', '?q=glicemia&type=analyses'],
+    'api_patients_lookup': ['?q=pop', '?q=19'],
+    'api_analytics': ['?dimensions=luna,tip_analiza', '?dimensions=sex,grupa_varsta&anormal=1'],
+    'api_patient_timeseries': ['?tip_analiza=Glicemia'],
+    'search': ['?q=pop']
+}
+
+# Cazuri POST care nu modifică date
+POST_CASES = [
+    ('api_validate_cnp_batch', '/api/validate-cnp/batch', lambda samples: {'cnps': samples['cnps'][:1000]})
+]
+
+
+class QueryCounter:
+    """Numără interogările SQL executate pe toate engine-urile aplicației"""
+
+    def __init__(self):
+        self.count = 0
+        with app.app_context():
+            for engine in db.engines.values():
+                event.listen(engine, 'before_cursor_execute', self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def percentiles(durations: list) -> dict:
+    """p50/p95/p99 în milisecunde"""
+    cuts = statistics.quantiles(durations, n=100, method='inclusive') if len(durations) > 1 else durations * 99
+    return {'p50': statistics.median(durations), 'p95': cuts[94], 'p99': cuts[98]}
+
+
+def measure(run, counter: QueryCounter, repeat: int, warmup: int) -> dict:
+    """Rulează run() de warmup + repeat ori; returnează percentilele, interogările SQL și statusul"""
+    status = None
+    for _ in range(warmup):
+        status = run()
+    durations = []
+    queries = []
+    for _ in range(repeat):
+        counter.count = 0
+        start = time.perf_counter()
+        status = run()
+        durations.append((time.perf_counter() - start) * 1000)
+        queries.append(counter.count)
+    return dict(percentiles(durations), sql=int(statistics.median(queries)), status=status)
+
+
+def load_samples() -> dict:
+    """Valorile folosite pentru argumentele rutelor (pacientul cu cele mai multe analize etc.)"""
+    with app.app_context():
+        patient_id = db.session.execute(
+            select(Analysis.patient_id).group_by(Analysis.patient_id)
+            .order_by(func.count(Analysis.id).desc(), Analysis.patient_id).limit(1)
+        ).scalar()
+        analysis_id = db.session.execute(
+            select(func.min(Analysis.id)).where(Analysis.patient_id == patient_id)
+        ).scalar()
+        cnps = list(db.session.execute(select(Patient.cnp).order_by(Patient.id).limit(10000)).scalars())
+    return {'patient_id': patient_id, 'analysis_id': analysis_id, 'object_id': patient_id, 'kind': 'patient',
+            'cnp': cnps[0], 'cnps': cnps}
+
+
+def route_arguments(rule, samples: dict):
+    """Argumentele unei reguli de rutare sau None dacă nu pot fi completate"""
+    values = {}
+    for argument in rule.arguments:
+        if argument == 'id':
+            values['id'] = samples['analysis_id'] if 'analysis' in rule.endpoint else samples['patient_id']
+        elif argument in samples:
+            values[argument] = samples[argument]
+        else:
+            return None
+    return values
+
+
+def route_cases(samples: dict) -> list:
+    """Cazurile end-to-end: toate rutele GET (cu variantele de query string) și cazurile POST"""
+    cases = []
+    with app.test_request_context():
+        for rule in sorted(app.url_map.iter_rules(), key=lambda r: r.rule):
+            if 'GET' not in rule.methods or rule.endpoint in SKIPPED_ENDPOINTS:
+                continue
+            values = route_arguments(rule, samples)
+            if values is None:
+                continue
+            path = app.url_for(rule.endpoint, **values)
+            for query in QUERY_VARIANTS.get(rule.endpoint, ['']):
+                cases.append((f'GET {rule.rule}{query}', 'GET', path + query, None))
+    for name, path, payload in POST_CASES:
+        cases.append((f'POST {path}', 'POST', path, payload(samples)))
+    return cases
+
+
+def micro_cases(samples: dict) -> list:
+    """Micro-benchmark-uri pe funcțiile din căile critice"""
+    with app.app_context():
+        pdf_source = load_pdf_source('patient', samples['patient_id'])
+
+    def in_context(func):
+        def run():
+            with app.app_context():
+                func()
+            return 'ok'
+        return run
+
+    return [
+        ('validate_cnp_array 10k', in_context(lambda: validate_cnp_array(samples['cnps']))),
+        ('lookup_patients pop', in_context(lambda: lookup_patients('pop', 10))),
+        ('compute_statistics', in_context(compute_statistics)),
+        ('get_rollup tip_analiza', in_context(lambda: get_rollup('tip_analiza', 'tip_analiza'))),
+        ('analytics_query luna x tip', in_context(lambda: analytics_query(['luna', 'tip_analiza'], {}))),
+        ('render_patient_pdf', in_context(lambda: render_patient_pdf(*pdf_source)))
+    ]
+
+
+def is_server_error(status) -> bool:
+    """True pentru statusurile HTTP 5xx (cazurile micro au statusul 'ok')"""
+    return isinstance(status, int) and status >= 500
+
+
+def compare(results: dict, baseline: dict, tolerance: float, min_delta_ms: float) -> list:
+    """Regresiile față de baseline: latență p50, număr de interogări SQL, status"""
+    regressions = []
+    for name, current in results.items():
+        if is_server_error(current['status']):
+            regressions.append(f"{name}: status {current['status']}")
+            continue
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        if current['status'] != previous['status']:
+            regressions.append(f"{name}: status {previous['status']} -> {current['status']}")
+        if current['sql'] > previous['sql']:
+            regressions.append(f"{name}: {previous['sql']} -> {current['sql']} interogări SQL")
+        limit = max(previous['p50'] * (1 + tolerance), previous['p50'] + min_delta_ms)
+        if current['p50'] > limit:
+            regressions.append(f"{name}: p50 {previous['p50']:.2f}ms -> {current['p50']:.2f}ms")
+    return regressions
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Suita de benchmark-uri cu comparație față de baseline')
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--analyses', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--only', help='Rulează doar cazurile al căror nume conține textul dat')
+    parser.add_argument('--baseline', default=str(BASELINE_PATH), help='Fișierul baseline (JSON)')
+    parser.add_argument('--save-baseline', action='store_true', help='Scrie rezultatele ca baseline nou')
+    parser.add_argument('--no-compare', action='store_true', help='Nu compară cu baseline-ul')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Creștere relativă admisă a p50 (0.5 = 50%%)')
+    parser.add_argument('--min-delta-ms', type=float, default=1.0, help='Creștere absolută a p50 ignorată')
+    parser.add_argument('--json', help='Scrie rezultatele complete în fișierul dat')
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    logging.disable(logging.CRITICAL)
+    app.config['PDF_CACHE_FOLDER'] = os.path.join(WORK_DIR, 'pdf_cache')
+    app.config['FRAGMENT_CACHE_FOLDER'] = os.path.join(WORK_DIR, 'fragment_cache')
+    os.makedirs(app.config['PDF_CACHE_FOLDER'], exist_ok=True)
+
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            start = time.perf_counter()
+            populate(db.engine, args.patients, args.analyses)
+            print(f"   gata în {time.perf_counter() - start:.1f}s")
+    upgrade_db()
+
+    samples = load_samples()
+    counter = QueryCounter()
+    client = app.test_client()
+
+    cases = [(f'micro {name}', run) for name, run in micro_cases(samples)]
+    for name, method, path, payload in route_cases(samples):
+        if method == 'GET':
+            cases.append((name, lambda path=path: client.get(path).status_code))
+        else:
+            cases.append((name, lambda path=path, payload=payload: client.post(path, json=payload).status_code))
+    if args.only:
+        cases = [(name, run) for name, run in cases if args.only in name]
+
+    results = {}
+    print(f"{'caz':<58}{'status':>7}{'p50':>9}{'p95':>9}{'p99':>9}{'sql':>6}")
+    for name, run in cases:
+        result = measure(run, counter, args.repeat, args.warmup)
+        results[name] = result
+        print(f"{name[:57]:<58}{str(result['status']):>7}{result['p50']:>9.2f}{result['p95']:>9.2f}"
+              f"{result['p99']:>9.2f}{result['sql']:>6}")
+
+    metadata = {'patients': args.patients, 'analyses': args.analyses, 'seed': args.seed, 'repeat': args.repeat,
+                'python': platform.python_version(), 'platform': platform.platform()}
+    document = {'metadata': metadata, 'results': results}
+    if args.json:
+        Path(args.json).write_text(json.dumps(document, indent=2, ensure_ascii=False), encoding='utf-8')
+
+    if args.save_baseline:
+        # Rutele care răspund cu 5xx nu sunt fixate în baseline ca rezultat așteptat
+        failed = [name for name, result in results.items() if is_server_error(result['status'])]
+        saved = dict(document, results={name: result for name, result in results.items() if name not in failed})
+        Path(args.baseline).write_text(json.dumps(saved, indent=2, ensure_ascii=False) + '\n', encoding='utf-8')
+        print(f"💾 Baseline salvat în {args.baseline}")
+        if failed:
+            print(f"❌ {len(failed)} cazuri cu eroare de server, omise din baseline:")
+            for name in failed:
+                print(f"   {name}: status {results[name]['status']}")
+            return 1
+        return 0
+
+    if args.no_compare or not os.path.exists(args.baseline):
+        return 0
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding='utf-8'))
+    scale = {key: baseline['metadata'].get(key) for key in ('patients', 'analyses', 'seed')}
+    if scale != {key: metadata[key] for key in scale}:
+        print(f"⚠️ Baseline-ul a fost generat cu alți parametri ({scale}); comparația este omisă")
+        return 0
+
+    regressions = compare(results, baseline['results'], args.tolerance, args.min_delta_ms)
+    if regressions:
+        print(f"❌ {len(regressions)} regresii față de {args.baseline}:")
+        for regression in regressions:
+            print(f"   {regression}")
+        return 1
+    print(f"✅ Fără regresii față de {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Generator de date sintetice pentru benchmark-uri (de la 10k la 10M de rânduri)
+
+Generarea și scrierea în masă sunt cele din aplicație (write_seed_rows, folosită și
+de run.py --seed N): CNP-uri valide și unice, coloanele structurate calculate cu
+aceleași funcții ca la scriere, insert() în loturi într-o singură tranzacție și
+indexuri reconstruite o singură dată, la final. Benchmark-urile apelează populate()
+pe baze temporare, fără agregate sau replică.
+
+Usage:
+    python benchmarks/synthetic_data.py --db /tmp/date.db --patients 100000 --analyses 2000000
+"""
+
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine
+
+from app import SEED_BATCH_SIZE, db, write_seed_rows
+
+
+def populate(engine, total_patients: int, total_analyses: int, batch_size: int = SEED_BATCH_SIZE,
+             search_index: bool = True) -> dict:
+    """
+    Încarcă pacienți și analize sintetice într-o bază cu schema aplicației
+
+    Returns:
+        dict: Numărul de rânduri și durata fiecărei etape (secunde)
+    """
+    return write_seed_rows(engine, total_patients, total_analyses, batch_size, search_index)
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Generare date sintetice într-o bază SQLite nouă')
+    parser.add_argument('--db', required=True, help='Fișier SQLite (creat dacă nu există)')
+    parser.add_argument('--patients', type=int, default=10000)
+    parser.add_argument('--analyses', type=int, default=100000)
+    parser.add_argument('--batch-size', type=int, default=SEED_BATCH_SIZE)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    if os.path.exists(args.db) and os.path.getsize(args.db) > 0:
+        parser.error(f"{args.db} există deja")
+
+    engine = create_engine(f'sqlite:///{args.db}')
+    db.metadata.create_all(engine)
+    print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize în {args.db}...")
+    report = populate(engine, args.patients, args.analyses, args.batch_size)
+    engine.dispose()
+
+    print(f"   pacienți: {report['patients_seconds']:.1f}s "
+          f"({report['patients'] / max(report['patients_seconds'], 1e-9):,.0f} rânduri/s)")
+    print(f"   analize:  {report['analyses_seconds']:.1f}s "
+          f"({report['analyses'] / max(report['analyses_seconds'], 1e-9):,.0f} rânduri/s)")
+    print(f"   indexuri: {report['indexes_seconds']:.1f}s, index de căutare: {report['search_index_seconds']:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
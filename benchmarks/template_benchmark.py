@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark pentru randarea șabloanelor: cache-ul de fragmente și cache-ul de bytecode Jinja
+
+1. Pornire la rece: prima randare a fiecărei pagini într-un proces nou, fără și cu
+   bytecode cache (fiecare scenariu rulează într-un subproces separat).
+2. Randare la cald: timpul per cerere fără cache de fragmente și cu backend-urile
+   "memory" și "disk".
+
+Usage:
+    python benchmarks/template_benchmark.py
+    python benchmarks/template_benchmark.py --patients 20000 --analyses 200000 --repeat 50
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+WORK_DIR = tempfile.mkdtemp()
+os.environ.setdefault('DATABASE_URL', f"sqlite:///{os.path.join(WORK_DIR, 'template_benchmark.db')}")
+
+from app import Analysis, app, db, upgrade_db
+from synthetic_data import populate
+
+URLS = ['/', '/patients', '/analyses', '/analyses/add', '/nu-exista']
+
+
+def cold_start(bytecode_folder: str) -> dict:
+    """Rulează într-un subproces nou și returnează durata primei randări per pagină"""
+    code = (
+        "import json, time\n"
+        "from jinja2 import FileSystemBytecodeCache\n"
+        "from app import app\n"
+        f"app.jinja_env.bytecode_cache = FileSystemBytecodeCache({bytecode_folder!r}) if {bytecode_folder!r} else None\n"
+        "client = app.test_client()\n"
+        "durations = {}\n"
+        f"for url in {URLS!r}:\n"
+        "    start = time.perf_counter()\n"
+        "    client.get(url)\n"
+        "    durations[url] = (time.perf_counter() - start) * 1000\n"
+        "print(json.dumps(durations))\n"
+    )
+    # cwd temporar: folderele create la import (uploads, pdf_cache, jinja_cache) nu ajung în repo
+    env = dict(os.environ, PYTHONPATH=str(ROOT))
+    output = subprocess.run([sys.executable, '-c', code], cwd=WORK_DIR, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def warm(client, backend, repeat: int) -> dict:
+    """Mediana duratei (ms) per pagină cu backend-ul de fragmente dat"""
+    app.config['FRAGMENT_CACHE_BACKEND'] = backend
+    app.config['FRAGMENT_CACHE_FOLDER'] = os.path.join(WORK_DIR, 'fragment_cache')
+    results = {}
+    for url in URLS:
+        client.get(url)
+        durations = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            client.get(url)
+            durations.append((time.perf_counter() - start) * 1000)
+        results[url] = statistics.median(durations)
+    return results
+
+
+def main():
+    """Funcția principală"""
+    parser = argparse.ArgumentParser(description='Benchmark cache de fragmente și bytecode Jinja')
+    parser.add_argument('--patients', type=int, default=5000)
+    parser.add_argument('--analyses', type=int, default=50000)
+    parser.add_argument('--repeat', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+
+    with app.app_context():
+        db.create_all()
+        empty = db.session.query(Analysis.id).first() is None
+        db.session.close()
+        if empty:
+            print(f"📦 Generare {args.patients} pacienți și {args.analyses} analize...")
+            populate(db.engine, args.patients, args.analyses)
+    upgrade_db()
+
+    bytecode_folder = os.path.join(WORK_DIR, 'jinja_cache')
+    os.makedirs(bytecode_folder, exist_ok=True)
+    cold_start(bytecode_folder)  # populează cache-ul de bytecode
+    without_bytecode = cold_start('')
+    with_bytecode = cold_start(bytecode_folder)
+
+    print("🧊 Prima randare într-un proces nou")
+    print(f"{'url':<16}{'fără bytecode':>16}{'cu bytecode':>14}")
+    for url in URLS:
+        print(f"{url:<16}{without_bytecode[url]:>14.1f}ms{with_bytecode[url]:>12.1f}ms")
+
+    client = app.test_client()
+    scenarios = {name: warm(client, backend, args.repeat)
+                 for name, backend in (('fără cache', None), ('memory', 'memory'), ('disk', 'disk'))}
+
+    print("🔥 Randare la cald (mediana per cerere)")
+    print(f"{'url':<16}" + ''.join(f"{name:>14}" for name in scenarios))
+    for url in URLS:
+        print(f"{url:<16}" + ''.join(f"{results[url]:>12.2f}ms" for results in scenarios.values()))
+
+
+if __name__ == '__main__':
+    main()
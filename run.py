@@ -8,7 +8,17 @@ Usage:
     python run.py --debug            # Rulare cu debug
     python run.py --production       # Rulare pentru producție
     python run.py --init-db          # Doar inițializare baza de date
+    python run.py --init-db --seed N # Inițializare cu N pacienți generați (10 analize/pacient)
     python run.py --reset-db         # Resetare completă baza de date
+    python run.py --export-pdf FILE  # Export rapoarte PDF pacienți în arhivă ZIP
+    python run.py --import-patients FILE   # Import pacienți din CSV/XLSX
+    python run.py --import-analyses FILE   # Import analize din CSV/XLSX
+    python run.py --backfill-results # Recalculare rezultate structurate/anormale
+    python run.py --rebuild-rollups  # Reconstruire agregate statistici
+    python run.py --check-rollups    # Verificare agregate statistici
+    python run.py --sync-replica     # Actualizare replică de citire SQLite locală
+    python run.py --migrate          # Aplicare migrări și rulare backfill-uri (reluabile)
+    python run.py --migration-status # Starea migrărilor și a backfill-urilor
 """
 
 import argparse
@@ -19,7 +29,9 @@ from pathlib import Path
 # Adaugă directorul curent în calea Python
 sys.path.insert(0, str(Path(__file__).parent))
 
-from app import app, init_db, db
+from app import (app, init_db, upgrade_db, db, import_records, iter_pdf_export_zip, select_export_patient_ids,
+                 backfill_structured_results, evaluate_abnormal_results, database_settings, sync_replica,
+                 rebuild_rollups, check_rollups, migration_status, run_pending_backfills)
 
 def run_development():
     """Rulează aplicația în modul dezvoltare"""
@@ -29,6 +41,7 @@ def run_development():
     print("📊 Baza de date: SQLite (dezvoltare)")
     print("-" * 50)
     
+    upgrade_db()
     app.run(
         debug=True,
         host='0.0.0.0',
@@ -44,31 +57,48 @@ def run_production():
     print("⚡ Server: Gunicorn")
     print("-" * 50)
     
+    upgrade_db()
+    
+    # Numărul de workeri poate fi ajustat prin WEB_CONCURRENCY; cu SQLite în modul WAL
+    # cititorii lucrează în paralel, dar scrierile rămân serializate pe lock-ul bazei de date
+    workers = os.environ.get('WEB_CONCURRENCY', '4')
+    
     try:
         import gunicorn
-        os.system("gunicorn -w 4 -b 0.0.0.0:8000 --access-logfile - --error-logfile - app:app")
+        os.system(f"gunicorn -w {workers} -b 0.0.0.0:8000 --access-logfile - --error-logfile - app:app")
     except ImportError:
         print("❌ Gunicorn nu este instalat!")
         print("💡 Instalați cu: pip install gunicorn")
         print("🔄 Rulez cu serverul Flask integrat...")
         app.run(debug=False, host='0.0.0.0', port=8000)
 
-def init_database():
-    """Inițializează baza de date"""
+def init_database(seed=None, seed_analyses=None):
+    """Inițializează baza de date (opțional cu date generate în masă)"""
     print("🗄️ Inițializare baza de date...")
     
     try:
-        init_db()
+        report = init_db(seed or 0, seed_analyses)
         print("✅ Baza de date inițializată cu succes!")
-        print("📊 Pacienți de test adăugați")
-        print("🧪 Analize de test adăugate")
+        if report:
+            print_seed_report(report)
+        else:
+            print("📊 Pacienți de test adăugați")
+            print("🧪 Analize de test adăugate")
     except Exception as e:
         print(f"❌ Eroare la inițializarea bazei de date: {e}")
         return False
     
     return True
 
-def reset_database():
+def print_seed_report(report):
+    """Afișează rândurile generate și viteza fiecărei etape"""
+    print(f"👥 Pacienți generați: {report['patients']} ({report['patients_per_second'] or 0:,.0f} rânduri/s)")
+    print(f"🧪 Analize generate: {report['analyses']} ({report['analyses_per_second'] or 0:,.0f} rânduri/s)")
+    print(f"🗂️ Indexuri: {report['indexes_seconds']:.1f}s, index de căutare: "
+          f"{report.get('search_index_seconds', 0):.1f}s, agregate: {report['rollups_seconds']:.1f}s")
+    print(f"⏱️ Total: {report['elapsed_seconds']:.1f}s")
+
+def reset_database(seed=None, seed_analyses=None):
     """Resetează complet baza de date"""
     print("⚠️ Resetare completă baza de date...")
     
@@ -91,8 +121,10 @@ def reset_database():
             print("🔄 Baza de date recreată")
         
         # Inițializează cu date noi
-        init_db()
+        report = init_db(seed or 0, seed_analyses)
         print("✅ Baza de date resetată și reinițializată cu succes!")
+        if report:
+            print_seed_report(report)
         
     except Exception as e:
         print(f"❌ Eroare la resetarea bazei de date: {e}")
@@ -100,6 +132,184 @@ def reset_database():
     
     return True
 
+def export_pdfs(output: str, laborator=None, data_start=None, data_end=None, workers=None):
+    """Exportă rapoartele PDF ale pacienților într-o arhivă ZIP"""
+    from datetime import datetime
+    import time
+    
+    print("📦 Export rapoarte PDF...")
+    
+    try:
+        data_start = datetime.strptime(data_start, '%Y-%m-%d').date() if data_start else None
+        data_end = datetime.strptime(data_end, '%Y-%m-%d').date() if data_end else None
+    except ValueError:
+        print("❌ Format dată incorect (YYYY-MM-DD)")
+        return False
+    
+    try:
+        start = time.perf_counter()
+        with app.app_context():
+            patient_ids = select_export_patient_ids(laborator, data_start, data_end)
+            print(f"👥 Pacienți selectați: {len(patient_ids)}")
+            
+            with open(output, 'wb') as f:
+                for chunk in iter_pdf_export_zip(patient_ids, workers=workers):
+                    f.write(chunk)
+        
+        elapsed = time.perf_counter() - start
+        print(f"✅ Arhiva {output} a fost creată în {elapsed:.1f}s "
+              f"({len(patient_ids) / elapsed if elapsed else 0:.1f} rapoarte/s)")
+    except Exception as e:
+        print(f"❌ Eroare la exportul PDF: {e}")
+        return False
+    
+    return True
+
+def import_file(kind: str, path: str):
+    """Importă pacienți sau analize dintr-un fișier CSV/XLSX"""
+    print(f"📥 Import {kind} din {path}...")
+    
+    if not os.path.exists(path):
+        print(f"❌ Fișierul {path} nu există")
+        return False
+    
+    try:
+        with app.app_context():
+            report = import_records(kind, path)
+    except Exception as e:
+        print(f"❌ Eroare la import: {e}")
+        return False
+    
+    print(f"📊 Rânduri procesate: {report['total_rows']}")
+    print(f"✅ Rânduri inserate: {report['inserted']}")
+    print(f"⚡ Viteză: {report['rows_per_second'] or 0} rânduri/s ({report['elapsed_seconds']}s)")
+    
+    if report['failed']:
+        print(f"⚠️ Rânduri respinse: {report['failed']}")
+        for error in report['errors'][:20]:
+            print(f"   rândul {error['row']}: {error['error']}")
+        if report['failed'] > 20:
+            print(f"   ... și încă {report['failed'] - 20} erori")
+    
+    return True
+
+def backfill_results():
+    """Recalculează rezultatele structurate și flag-urile de anormalitate"""
+    print("🧪 Recalculare rezultate structurate...")
+    
+    try:
+        upgrade_db()
+        with app.app_context():
+            processed = backfill_structured_results()
+            changed = evaluate_abnormal_results()
+        print(f"✅ {processed} analize procesate, {changed} flag-uri corectate")
+    except Exception as e:
+        print(f"❌ Eroare la recalculare: {e}")
+        return False
+    
+    return True
+
+def rebuild_statistics():
+    """Reconstruiește agregatele materializate pentru statistici"""
+    print("📊 Reconstruire agregate statistici...")
+    
+    try:
+        upgrade_db()
+        with app.app_context():
+            keys = rebuild_rollups()
+    except Exception as e:
+        print(f"❌ Eroare la reconstruirea agregatelor: {e}")
+        return False
+    
+    print(f"✅ Agregate reconstruite: {keys} chei")
+    return True
+
+def check_statistics():
+    """Verifică agregatele materializate față de analize"""
+    print("🔍 Verificare agregate statistici...")
+    
+    upgrade_db()
+    with app.app_context():
+        differences = check_rollups()
+    
+    if differences:
+        for diff in differences[:20]:
+            print(f"   ❌ {diff['dimensiune']}={diff['cheie']}: așteptat {diff['asteptat']}, stocat {diff['stocat']}")
+        print(f"⚠️ {len(differences)} diferențe; rulați python run.py --rebuild-rollups")
+        return False
+    
+    print("✅ Agregatele sunt consistente")
+    return True
+
+def sync_read_replica():
+    """Copiază baza principală în replica SQLite locală (DATABASE_REPLICA_URL)"""
+    print("🔁 Sincronizare replică de citire...")
+    
+    try:
+        if not sync_replica():
+            print("ℹ️ Nu există o replică SQLite locală configurată (DATABASE_REPLICA_URL)")
+            return False
+    except Exception as e:
+        print(f"❌ Eroare la sincronizarea replicii: {e}")
+        return False
+    
+    print("✅ Replica a fost sincronizată")
+    return True
+
+def migrate(pause=None, batch_size=None):
+    """Aplică migrările și rulează backfill-urile rămase, cu progres"""
+    print("🧱 Aplicare migrări...")
+    
+    try:
+        applied = upgrade_db()
+    except Exception as e:
+        print(f"❌ Eroare la aplicarea migrărilor: {e}")
+        return False
+    
+    for migration_id in applied:
+        print(f"   ✅ {migration_id}")
+    if not applied:
+        print("   ℹ️ Nicio migrare nouă")
+    
+    def progress(backfill):
+        print(f"\r   ⏳ {backfill.name}: {backfill.processed} rânduri (id ≤ {backfill.last_id})", end='', flush=True)
+    
+    try:
+        with app.app_context():
+            results = run_pending_backfills(pause=pause, batch_size=batch_size, retry_errors=True, progress=progress)
+    except KeyboardInterrupt:
+        print("\n⏸️ Backfill întrerupt; rulați din nou --migrate pentru a continua de la checkpoint")
+        return False
+    except Exception as e:
+        print(f"\n❌ Eroare în backfill: {e}")
+        return False
+    
+    for name, processed in results.items():
+        if processed is None:
+            print(f"\n   ⚠️ {name}: rulează deja în alt proces (lease activ)")
+        else:
+            print(f"\n   ✅ {name}: {processed} rânduri")
+    print("✅ Schema este la zi")
+    return True
+
+def show_migration_status():
+    """Afișează migrările aplicate și progresul backfill-urilor"""
+    upgrade_db()
+    with app.app_context():
+        status = migration_status()
+    
+    print("🧱 Migrări:")
+    for item in status['migrations']:
+        state = f"aplicată {item['applied_at']} ({item['duration_ms']} ms)" if item['applied_at'] else 'în așteptare'
+        print(f"   {item['id']}: {state}")
+    print("⏳ Backfill-uri:")
+    for item in status['backfills']:
+        error = f" - {item['error']}" if item['error'] else ''
+        print(f"   {item['name']}: {item['status']}, {item['processed']} rânduri, id ≤ {item['last_id']}{error}")
+    if not status['backfills']:
+        print("   ℹ️ Niciun backfill programat")
+    return True
+
 def check_requirements():
     """Verifică dacă toate dependințele sunt instalate"""
     print("🔍 Verificare dependințe...")
@@ -126,6 +336,11 @@ def check_requirements():
         return False
     
     print("✅ Toate dependințele sunt instalate!")
+    
+    print("\n🗄️ Configurare bază de date:")
+    with app.app_context():
+        for name, value in database_settings().items():
+            print(f"   {name}: {value}")
     return True
 
 def show_system_info():
@@ -150,8 +365,16 @@ Exemple de utilizare:
   python run.py --debug         Rulare cu debug explicit
   python run.py --production    Rulare pentru producție
   python run.py --init-db       Doar inițializare baza de date
+  python run.py --init-db --seed 1000000
+                                Inițializare cu 1.000.000 pacienți și 10.000.000 analize generate
   python run.py --reset-db      Resetare completă baza de date
   python run.py --check         Verificare dependințe
+  python run.py --export-pdf rapoarte.zip --laborator Synevo
+                                Export rapoarte PDF în arhivă ZIP
+  python run.py --import-patients pacienti.csv
+                                Import pacienți din CSV/XLSX
+  python run.py --migrate --backfill-pause 0.5
+                                Migrări + backfill-uri cu pauză mai mare între loturi
         """
     )
     
@@ -163,4 +386,88 @@ Exemple de utilizare:
                        help='Inițializează baza de date')
     parser.add_argument('--reset-db', action='store_true',
                        help='Resetează complet baza de date')
-    parser.add_argument()
\ No newline at end of file
+    parser.add_argument('--seed', type=int, metavar='N',
+                       help='Cu --init-db/--reset-db: generează în masă N pacienți sintetici')
+    parser.add_argument('--seed-analyses', type=int, metavar='M',
+                       help='Numărul de analize generate cu --seed (implicit 10 per pacient)')
+    parser.add_argument('--check', action='store_true',
+                       help='Verifică dependințele')
+    parser.add_argument('--export-pdf', metavar='FILE',
+                       help='Exportă rapoartele PDF ale pacienților în arhiva ZIP indicată')
+    parser.add_argument('--laborator',
+                       help='Filtru export: doar pacienții cu analize la acest laborator')
+    parser.add_argument('--data-start',
+                       help='Filtru export: data rezultatului de la (YYYY-MM-DD)')
+    parser.add_argument('--data-end',
+                       help='Filtru export: data rezultatului până la (YYYY-MM-DD)')
+    parser.add_argument('--workers', type=int,
+                       help='Numărul de procese pentru randarea PDF (implicit: toate nucleele)')
+    parser.add_argument('--import-patients', metavar='FILE',
+                       help='Importă pacienți din fișier CSV/XLSX')
+    parser.add_argument('--import-analyses', metavar='FILE',
+                       help='Importă analize din fișier CSV/XLSX (pacientul identificat prin coloana cnp)')
+    parser.add_argument('--rebuild-rollups', action='store_true',
+                       help='Reconstruiește agregatele pentru statistici')
+    parser.add_argument('--check-rollups', action='store_true',
+                       help='Verifică agregatele pentru statistici față de analize')
+    parser.add_argument('--sync-replica', action='store_true',
+                       help='Copiază baza principală în replica SQLite locală')
+    parser.add_argument('--backfill-results', action='store_true',
+                       help='Recalculează valorile numerice și rezultatele anormale pentru toate analizele')
+    parser.add_argument('--migrate', action='store_true',
+                       help='Aplică migrările și rulează backfill-urile rămase (reluabile după întrerupere)')
+    parser.add_argument('--migration-status', action='store_true',
+                       help='Afișează starea migrărilor și a backfill-urilor')
+    parser.add_argument('--backfill-pause', type=float,
+                       help='Secunde de pauză între loturile de backfill (implicit BACKFILL_PAUSE)')
+    parser.add_argument('--backfill-batch-size', type=int,
+                       help='Rânduri per lot de backfill (implicit BACKFILL_BATCH_SIZE)')
+    
+    args = parser.parse_args()
+    
+    if args.check:
+        sys.exit(0 if check_requirements() else 1)
+    
+    if args.init_db:
+        sys.exit(0 if init_database(args.seed, args.seed_analyses) else 1)
+    
+    if args.reset_db:
+        sys.exit(0 if reset_database(args.seed, args.seed_analyses) else 1)
+    
+    if args.export_pdf:
+        sys.exit(0 if export_pdfs(args.export_pdf, args.laborator, args.data_start,
+                                  args.data_end, args.workers) else 1)
+    
+    if args.import_patients:
+        sys.exit(0 if import_file('patients', args.import_patients) else 1)
+    
+    if args.import_analyses:
+        sys.exit(0 if import_file('analyses', args.import_analyses) else 1)
+    
+    if args.backfill_results:
+        sys.exit(0 if backfill_results() else 1)
+    
+    if args.rebuild_rollups:
+        sys.exit(0 if rebuild_statistics() else 1)
+    
+    if args.check_rollups:
+        sys.exit(0 if check_statistics() else 1)
+    
+    if args.sync_replica:
+        sys.exit(0 if sync_read_replica() else 1)
+    
+    if args.migrate:
+        sys.exit(0 if migrate(args.backfill_pause, args.backfill_batch_size) else 1)
+    
+    if args.migration_status:
+        sys.exit(0 if show_migration_status() else 1)
+    
+    show_system_info()
+    
+    if args.production:
+        run_production()
+    else:
+        run_development()
+
+if __name__ == '__main__':
+    main()